@@ -27,6 +27,7 @@ from mycroft.util.log import LOG
 import mycroft.skills.mycroft_skill as mycroft_skill
 import mycroft.skills.fallback_skill as fallback_skill
 from .mycroft_skill import *  # noqa
+from .skill_data import load_vocabulary  # noqa
 
 
 class MycroftSkill(mycroft_skill.MycroftSkill):
@@ -157,6 +157,8 @@ class IntentService:
 
         # Dictionary for translating a skill id to a name
         self.skill_names = {}
+        # Detached intent parsers kept for reattaching, keyed by name
+        self.detached_intents = {}
         # Context related intializations
         self.context_keywords = self.config.get('keywords', [])
         self.context_max_frames = self.config.get('max_frames', 3)
@@ -165,9 +167,11 @@ class IntentService:
         self.context_manager = ContextManager(self.context_timeout)
         self.bus = bus
         self.bus.on('register_vocab', self.handle_register_vocab)
+        self.bus.on('register_vocab_batch', self.handle_register_vocab_batch)
         self.bus.on('register_intent', self.handle_register_intent)
         self.bus.on('recognizer_loop:utterance', self.handle_utterance)
         self.bus.on('detach_intent', self.handle_detach_intent)
+        self.bus.on('reattach_intent', self.handle_reattach_intent)
         self.bus.on('detach_skill', self.handle_detach_skill)
         # Context related handlers
         self.bus.on('add_context', self.handle_add_context)
@@ -454,10 +458,18 @@ class IntentService:
         return best_intent
 
     def handle_register_vocab(self, message):
-        start_concept = message.data.get('start')
-        end_concept = message.data.get('end')
-        regex_str = message.data.get('regex')
-        alias_of = message.data.get('alias_of')
+        self._register_vocab(message.data)
+
+    def handle_register_vocab_batch(self, message):
+        """Register all vocabulary entries sent by a skill in one message."""
+        for entry in message.data.get('entries', []):
+            self._register_vocab(entry)
+
+    def _register_vocab(self, data):
+        start_concept = data.get('start')
+        end_concept = data.get('end')
+        regex_str = data.get('regex')
+        alias_of = data.get('alias_of')
         if regex_str:
             self.engine.register_regex_entity(regex_str)
         else:
@@ -466,20 +478,38 @@ class IntentService:
 
     def handle_register_intent(self, message):
         intent = open_intent_envelope(message)
+        self.detached_intents.pop(intent.name, None)
         self.engine.register_intent_parser(intent)
 
     def handle_detach_intent(self, message):
         intent_name = message.data.get('intent_name')
-        new_parsers = [
-            p for p in self.engine.intent_parsers if p.name != intent_name]
+        new_parsers = []
+        for p in self.engine.intent_parsers:
+            if p.name == intent_name:
+                self.detached_intents[intent_name] = p
+            else:
+                new_parsers.append(p)
         self.engine.intent_parsers = new_parsers
 
+    def handle_reattach_intent(self, message):
+        """Register a previously detached intent parser again."""
+        intent_name = message.data.get('name')
+        intent = self.detached_intents.pop(intent_name, None)
+        if intent is None:
+            LOG.warning('Can not reattach ' + str(intent_name) +
+                        ', it has not been detached')
+        else:
+            self.engine.register_intent_parser(intent)
+
     def handle_detach_skill(self, message):
         skill_id = message.data.get('skill_id')
         new_parsers = [
             p for p in self.engine.intent_parsers if
             not p.name.startswith(skill_id)]
         self.engine.intent_parsers = new_parsers
+        self.detached_intents = {
+            name: p for name, p in self.detached_intents.items()
+            if not name.startswith(skill_id)}
 
     def handle_add_context(self, message):
         """ Add context
@@ -17,17 +17,17 @@
 import sys
 import re
 import traceback
-import inspect
 from inspect import signature
 import collections
+from functools import lru_cache
 import time
 from datetime import datetime, timedelta
 import csv
 from itertools import chain
 from adapt.intent import Intent, IntentBuilder
 from os import walk
-from os.path import join, abspath, dirname, basename, exists
-from threading import Event, Timer
+from os.path import join, abspath, dirname, basename, exists, getmtime
+from threading import Event
 
 from mycroft import dialog
 from mycroft.api import DeviceApi
@@ -44,7 +44,7 @@ from mycroft.util import (camel_case_split,
                           play_audio_file)
 from mycroft.util.log import LOG
 from .settings import SkillSettings
-from .skill_data import (load_vocabulary, load_regex, to_alnum,
+from .skill_data import (read_vocabulary, load_regex, to_alnum,
                          munge_regex, munge_intent_parser, read_vocab_file)
 
 
@@ -66,13 +66,17 @@ def simple_trace(stack_trace):
 
 def dig_for_message():
     """Dig Through the stack for message."""
-    stack = inspect.stack()
+    # Walk the frames directly, inspect.stack() reads the source file for
+    # every frame on the stack.
+    frame = sys._getframe(1)
     # Limit search to 10 frames back
-    stack = stack if len(stack) < 10 else stack[:10]
-    local_vars = [frame[0].f_locals for frame in stack]
-    for l in local_vars:
-        if 'message' in l and isinstance(l['message'], Message):
-            return l['message']
+    for _ in range(10):
+        if frame is None:
+            break
+        message = frame.f_locals.get('message')
+        if isinstance(message, Message):
+            return message
+        frame = frame.f_back
 
 
 def unmunge_message(message, skill_id):
@@ -82,20 +86,38 @@ def unmunge_message(message, skill_id):
         message (Message): Intent result message
         skill_id (str): skill identifier
 
+    Returns:
+        Message without clear keywords
+    """
+    return _unmunge_message(message, to_alnum(skill_id))
+
+
+def _unmunge_message(message, alnum_skill_id):
+    """Restore message keywords using an already letterified skill ID.
+
+    Arguments:
+        message (Message): Intent result message
+        alnum_skill_id (str): skill identifier converted by to_alnum()
+
     Returns:
         Message without clear keywords
     """
     if isinstance(message, Message) and isinstance(message.data, dict):
-        skill_id = to_alnum(skill_id)
         for key in list(message.data.keys()):
-            if key.startswith(skill_id):
+            if key.startswith(alnum_skill_id):
                 # replace the munged key with the real one
-                new_key = key[len(skill_id):]
+                new_key = key[len(alnum_skill_id):]
                 message.data[new_key] = message.data.pop(key)
 
     return message
 
 
+@lru_cache(maxsize=256)
+def _compile_regex(regex):
+    """Compile a regex, caching the result for repeated registrations."""
+    return re.compile(regex)
+
+
 def open_intent_envelope(message):
     """Convert dictionary received over messagebus to Intent."""
     intent_dict = message.data
@@ -114,7 +136,7 @@ def get_handler_name(handler):
     Returns:
         string: handler name as string
     """
-    if '__self__' in dir(handler) and 'name' in dir(handler.__self__):
+    if hasattr(handler, '__self__') and hasattr(handler.__self__, 'name'):
         return handler.__self__.name + '.' + handler.__name__
     else:
         return handler.__name__
@@ -175,6 +197,47 @@ class MycroftSkill:
         bus (MycroftWebsocketClient): Optional bus connection
         use_settings (bool): Set to false to not use skill settings at all
     """
+    @classmethod
+    def _get_decorated(cls):
+        """Collect the decorated methods of a skill class.
+
+        The attributes are resolved through the MRO once per class and
+        cached in the class itself, so loading a skill doesn't need to
+        inspect every attribute of the instance.
+
+        Returns:
+            tuple: (intent handler names, intent file handler names,
+                    resting screen handler name or None)
+        """
+        decorated = cls.__dict__.get('_decorated_methods')
+        if decorated is not None:
+            return decorated
+
+        attributes = {}
+        for klass in reversed(cls.__mro__):
+            attributes.update(vars(klass))
+
+        intents = []
+        intent_files = []
+        resting_handler_name = None
+        for attr_name in sorted(attributes):
+            attr = attributes[attr_name]
+            # Only methods can be decorated, this also leaves properties
+            # unevaluated
+            if not callable(attr):
+                continue
+            if hasattr(attr, 'intents'):
+                intents.append(attr_name)
+            if hasattr(attr, 'intent_files'):
+                intent_files.append(attr_name)
+            if (resting_handler_name is None and
+                    hasattr(attr, 'resting_handler')):
+                resting_handler_name = attr_name
+
+        decorated = (tuple(intents), tuple(intent_files),
+                     resting_handler_name)
+        cls._decorated_methods = decorated
+        return decorated
 
     def __init__(self, name=None, bus=None, use_settings=True):
         self.name = name or self.__class__.__name__
@@ -202,12 +265,18 @@ class MycroftSkill:
         #: See mycroft.filesystem for details.
         self.file_system = FileSystemAccess(join('skills', self.name))
         self.registered_intents = []
+        self._intent_map = {}  # registered intents keyed by name
         self.log = LOG.create_logger(self.name)  #: Skill logger instance
         self.reload_skill = True  #: allow reloading (default True)
-        self.events = []
-        self.scheduled_repeats = []
+        self.events = {}  # registered handlers keyed by message type
+        self.scheduled_repeats = set()
+        self._skill_id_cache = (None, '', '')
         self.skill_id = ''  # will be set from the path, so guaranteed unique
         self.voc_match_cache = {}
+        self._resource_cache = {}
+        self._template_cache = {}
+        self._locale_dir_cache = None  # only used by load_data_files()
+        self._ack_audio_file = None  # resolved on first acknowledge()
 
     @property
     def enclosure(self):
@@ -234,14 +303,47 @@ class MycroftSkill:
         """Provide deprecation warning when accessing config.
         TODO: Remove in 19.08
         """
-        stack = simple_trace(traceback.format_stack())
-        if (" _register_decorated" not in stack and
-                "register_resting_screen" not in stack):
-            LOG.warning('self.config is deprecated.  Switch to using '
-                        'self.setting["whatever"] within your skill.')
-            LOG.warning(stack)
+        # Check the names of the closest callers, the stack trace is only
+        # extracted and formatted if the warning is actually logged.
+        frame = sys._getframe(1)
+        for _ in range(5):
+            if frame is None:
+                break
+            if frame.f_code.co_name in ('_register_decorated',
+                                        'register_resting_screen'):
+                return self._config
+            frame = frame.f_back
+
+        LOG.warning('self.config is deprecated.  Switch to using '
+                    'self.setting["whatever"] within your skill.')
+        LOG.warning(simple_trace(traceback.format_stack()))
         return self._config
 
+    def _get_skill_id_cache(self):
+        """Get the strings derived from the skill_id.
+
+        The strings are cached until the skill_id changes.
+
+        Returns:
+            tuple: (skill_id, alphanumeric skill_id, "<skill_id>:")
+        """
+        cache = self._skill_id_cache
+        if cache[0] != self.skill_id:
+            cache = (self.skill_id, to_alnum(self.skill_id),
+                     str(self.skill_id) + ':')
+            self._skill_id_cache = cache
+        return cache
+
+    @property
+    def _alnum_skill_id(self):
+        """Get the skill_id converted to alphanumeric characters."""
+        return self._get_skill_id_cache()[1]
+
+    @property
+    def _skill_id_colon(self):
+        """Get the "<skill_id>:" prefix used for unique names."""
+        return self._get_skill_id_cache()[2]
+
     @property
     def location(self):
         """Get the JSON data struction holding location information."""
@@ -253,16 +355,16 @@ class MycroftSkill:
     def location_pretty(self):
         """Get a more 'human' version of the location as a string."""
         loc = self.location
-        if type(loc) is dict and loc["city"]:
-            return loc["city"]["name"]
+        if isinstance(loc, dict) and loc.get('city'):
+            return loc['city'].get('name')
         return None
 
     @property
     def location_timezone(self):
         """Get the timezone code, such as 'America/Los_Angeles'"""
         loc = self.location
-        if type(loc) is dict and loc["timezone"]:
-            return loc["timezone"]["code"]
+        if isinstance(loc, dict) and loc.get('timezone'):
+            return loc['timezone'].get('code')
         return None
 
     @property
@@ -308,11 +410,11 @@ class MycroftSkill:
             func (Function): function to be invoked
         """
         self.bus.on(msg_type, func)
-        self.events.append((msg_type, func))
+        self.events.setdefault(msg_type, []).append(func)
 
     def detach(self):
         for (name, intent) in self.registered_intents:
-            name = str(self.skill_id) + ':' + name
+            name = self._skill_id_colon + name
             self.bus.emit(Message("detach_intent", {"intent_name": name}))
 
     def initialize(self):
@@ -406,19 +508,16 @@ class MycroftSkill:
         """
         data = data or {}
 
-        def get_announcement():
-            return self.dialog_renderer.render(dialog, data)
-
-        if not get_announcement():
+        announcement = self.dialog_renderer.render(dialog, data)
+        if not announcement:
             raise ValueError('dialog message required')
 
         def on_fail_default(utterance):
-            fail_data = data.copy()
-            fail_data['utterance'] = utterance
             if on_fail:
+                fail_data = dict(data, utterance=utterance)
                 return self.dialog_renderer.render(on_fail, fail_data)
             else:
-                return get_announcement()
+                return announcement
 
         def is_cancel(utterance):
             return self.voc_match(utterance, 'cancel')
@@ -430,7 +529,7 @@ class MycroftSkill:
         validator = validator or validator_default
         on_fail_fn = on_fail if callable(on_fail) else on_fail_default
 
-        self.speak(get_announcement(), expect_response=True, wait=True)
+        self.speak(announcement, expect_response=True, wait=True)
         num_fails = 0
         while True:
             response = self.__get_response()
@@ -507,13 +606,19 @@ class MycroftSkill:
             if not voc or not exists(voc):
                 raise FileNotFoundError(
                         'Could not find {}.voc file'.format(voc_filename))
-            # load vocab and flatten into a simple list
-            vocab = list(chain(*read_vocab_file(voc)))
-            self.voc_match_cache[cache_key] = vocab
-        if utt:
-            # Check for matches against complete words
-            return any([re.match(r'.*\b' + i + r'\b.*', utt)
-                        for i in self.voc_match_cache[cache_key]])
+            # load vocab, flatten and combine into a single pattern matching
+            # any of the complete words. Expanded alternatives often repeat,
+            # only keep the first occurrence of each.
+            vocab = list(dict.fromkeys(chain(*read_vocab_file(voc))))
+            if vocab:
+                pattern = re.compile(
+                    r'\b(?:' + '|'.join(re.escape(v) for v in vocab) + r')\b')
+            else:
+                pattern = None
+            self.voc_match_cache[cache_key] = pattern
+        pattern = self.voc_match_cache[cache_key]
+        if utt and pattern:
+            return bool(pattern.search(utt))
         else:
             return False
 
@@ -561,26 +666,25 @@ class MycroftSkill:
         This only allows one screen and if two is registered only one
         will be used.
         """
-        attributes = [a for a in dir(self)]
-        for attr_name in attributes:
-            method = getattr(self, attr_name)
+        resting_handler_name = self._get_decorated()[2]
+        if resting_handler_name is None:
+            return
 
-            if hasattr(method, 'resting_handler'):
-                self.resting_name = method.resting_handler
-                self.log.info('Registering resting screen {} for {}.'.format(
-                              method, self.resting_name))
+        method = getattr(self, resting_handler_name)
+        self.resting_name = method.resting_handler
+        self.log.info('Registering resting screen {} for {}.'.format(
+                      method, self.resting_name))
 
-                # Register for handling resting screen
-                msg_type = '{}.{}'.format(self.skill_id, 'idle')
-                self.add_event(msg_type, method)
-                # Register handler for resting screen collect message
-                self.add_event('mycroft.mark2.collect_idle',
-                               self._handle_collect_resting)
+        # Register for handling resting screen
+        msg_type = '{}.{}'.format(self.skill_id, 'idle')
+        self.add_event(msg_type, method)
+        # Register handler for resting screen collect message
+        self.add_event('mycroft.mark2.collect_idle',
+                       self._handle_collect_resting)
 
-                # Do a send at load to make sure the skill is registered
-                # if reloaded
-                self._handle_collect_resting()
-                return
+        # Do a send at load to make sure the skill is registered
+        # if reloaded
+        self._handle_collect_resting()
 
     def _register_decorated(self):
         """Register all intent handlers that are decorated with an intent.
@@ -588,17 +692,16 @@ class MycroftSkill:
         Looks for all functions that have been marked by a decorator
         and read the intent data from them
         """
-        attributes = [a for a in dir(self)]
-        for attr_name in attributes:
+        intents, intent_files, _ = self._get_decorated()
+        for attr_name in intents:
             method = getattr(self, attr_name)
+            for intent in getattr(method, 'intents'):
+                self.register_intent(intent, method)
 
-            if hasattr(method, 'intents'):
-                for intent in getattr(method, 'intents'):
-                    self.register_intent(intent, method)
-
-            if hasattr(method, 'intent_files'):
-                for intent_file in getattr(method, 'intent_files'):
-                    self.register_intent_file(intent_file, method)
+        for attr_name in intent_files:
+            method = getattr(self, attr_name)
+            for intent_file in getattr(method, 'intent_files'):
+                self.register_intent_file(intent_file, method)
 
     def translate(self, text, data=None):
         """Load a translatable single string resource
@@ -635,9 +738,24 @@ class MycroftSkill:
                                             'dialog', 'vocab', 'regex' or 'ui'.
                                             Defaults to None.
 
+        The result is cached per skill, the cache is cleared when the data
+        files are (re)loaded.
+
         Returns:
             string: The full path to the resource file or None if not found
         """
+        key = (res_name, res_dirname, self.lang)
+        if key not in self._resource_cache:
+            self._resource_cache[key] = self._find_resource(res_name,
+                                                            res_dirname)
+        return self._resource_cache[key]
+
+    def _find_resource(self, res_name, res_dirname=None):
+        """Search the skill directories for a resource file.
+
+        See find_resource() for the search scheme, this does the actual
+        file system lookup without caching the result.
+        """
         if res_dirname:
             # Try the old translated directory (dialog/vocab/regex)
             path = join(self.root_dir, res_dirname, self.lang, res_name)
@@ -682,11 +800,16 @@ class MycroftSkill:
             filename = self.find_resource(name, 'dialog')
             if filename:
                 with open(filename) as f:
-                    reader = csv.reader(f, delimiter=delim)
-                    for row in reader:
+                    for line in f:
+                        line = line.rstrip('\r\n')
                         # skip blank or comment lines
-                        if not row or row[0].startswith("#"):
+                        if not line or line.startswith(('#', '//')):
                             continue
+                        if '"' in line:
+                            # Quoted values need the full csv parser
+                            row = next(csv.reader([line], delimiter=delim))
+                        else:
+                            row = line.split(delim)
                         if len(row) != 2:
                             continue
 
@@ -737,9 +860,17 @@ class MycroftSkill:
         """Load and render lines from dialog/<lang>/<name>"""
         filename = self.find_resource(name, 'dialog')
         if filename:
-            with open(filename) as f:
-                text = f.read().replace('{{', '{').replace('}}', '}')
-                return text.format(**data or {}).rstrip('\n').split('\n')
+            # Cache the file contents converted to format syntax together
+            # with the modification time so edited files are reloaded
+            mtime = getmtime(filename)
+            cached = self._template_cache.get(filename)
+            if cached is not None and cached[0] == mtime:
+                text = cached[1]
+            else:
+                with open(filename) as f:
+                    text = f.read().replace('{{', '{').replace('}}', '}')
+                self._template_cache[filename] = (mtime, text)
+            return text.format(**data or {}).rstrip('\n').split('\n')
         else:
             return None
 
@@ -754,12 +885,18 @@ class MycroftSkill:
             once (bool, optional): Event handler will be removed after it has
                                    been run once.
         """
+        # Check the handler name and arguments once instead of on every call
+        handler_name_str = get_handler_name(handler) if handler else None
+        try:
+            takes_message = len(signature(handler).parameters) != 0
+        except (TypeError, ValueError):
+            takes_message = True
 
         def wrapper(message):
-            skill_data = {'name': get_handler_name(handler)}
+            skill_data = {'name': handler_name_str}
             stopwatch = Stopwatch()
             try:
-                message = unmunge_message(message, self.skill_id)
+                message = _unmunge_message(message, self._alnum_skill_id)
                 # Indicate that the skill handler is starting
                 if handler_info:
                     # Indicate that the skill handler is starting if requested
@@ -772,11 +909,16 @@ class MycroftSkill:
                     self.remove_event(name)
 
                 with stopwatch:
-                    if len(signature(handler).parameters) == 0:
-                        handler()
-                    else:
+                    if takes_message:
                         handler(message)
-                    self.settings.store()  # Store settings if they've changed
+                    else:
+                        handler()
+                    # Store settings if they've changed, values changed in
+                    # place don't set the dirty flag so compare the content
+                    if self.settings is not None and (
+                            self.settings.dirty or
+                            not self.settings._is_stored):
+                        self.settings.store()
 
             except Exception as e:
                 # Convert "MyFancySkill" to "My Fancy Skill" for speaking
@@ -805,24 +947,17 @@ class MycroftSkill:
                 self.bus.once(name, wrapper)
             else:
                 self.bus.on(name, wrapper)
-            self.events.append((name, wrapper))
+            self.events.setdefault(name, []).append(wrapper)
 
     def remove_event(self, name):
-        """Removes an event from bus emitter and events list.
+        """Removes an event from bus emitter and registered events.
 
         Args:
             name (string): Name of Intent or Scheduler Event
         Returns:
             bool: True if found and removed, False if not found
         """
-        removed = False
-        for _name, _handler in list(self.events):
-            if name == _name:
-                try:
-                    self.events.remove((_name, _handler))
-                except ValueError:
-                    pass
-                removed = True
+        removed = bool(self.events.pop(name, None))
 
         # Because of function wrappers, the emitter doesn't always directly
         # hold the _handler function, it sometimes holds something like
@@ -853,6 +988,7 @@ class MycroftSkill:
         munge_intent_parser(intent_parser, name, self.skill_id)
         self.bus.emit(Message("register_intent", intent_parser.__dict__))
         self.registered_intents.append((name, intent_parser))
+        self._intent_map[name] = intent_parser
         self.add_event(intent_parser.name, handler, 'mycroft.skill.handler')
 
     def register_intent_file(self, intent_file, handler):
@@ -882,7 +1018,7 @@ class MycroftSkill:
                          '.intent'
             handler:     function to register with intent
         """
-        name = str(self.skill_id) + ':' + intent_file
+        name = self._skill_id_colon + intent_file
 
         filename = self.find_resource(intent_file, 'vocab')
         if not filename:
@@ -896,6 +1032,7 @@ class MycroftSkill:
         }
         self.bus.emit(Message("padatious:register_intent", data))
         self.registered_intents.append((intent_file, data))
+        self._intent_map[intent_file] = data
         self.add_event(name, handler, 'mycroft.skill.handler')
 
     def register_entity_file(self, entity_file):
@@ -923,7 +1060,7 @@ class MycroftSkill:
             raise FileNotFoundError(
                 'Unable to find "' + entity_file + '.entity"'
                 )
-        name = str(self.skill_id) + ':' + entity_file
+        name = self._skill_id_colon + entity_file
 
         self.bus.emit(Message("padatious:register_entity", {
             "file_name": filename,
@@ -934,17 +1071,15 @@ class MycroftSkill:
         """Listener to enable a registered intent if it belongs to this skill.
         """
         intent_name = message.data["intent_name"]
-        for (name, intent) in self.registered_intents:
-            if name == intent_name:
-                return self.enable_intent(intent_name)
+        if intent_name in self._intent_map:
+            return self.enable_intent(intent_name)
 
     def handle_disable_intent(self, message):
         """Listener to disable a registered intent if it belongs to this skill.
         """
         intent_name = message.data["intent_name"]
-        for (name, intent) in self.registered_intents:
-            if name == intent_name:
-                return self.disable_intent(intent_name)
+        if intent_name in self._intent_map:
+            return self.disable_intent(intent_name)
 
     def disable_intent(self, intent_name):
         """Disable a registered intent if it belongs to this skill.
@@ -955,10 +1090,9 @@ class MycroftSkill:
         Returns:
                 bool: True if disabled, False if it wasn't registered
         """
-        names = [intent_tuple[0] for intent_tuple in self.registered_intents]
-        if intent_name in names:
+        if intent_name in self._intent_map:
             LOG.debug('Disabling intent ' + intent_name)
-            name = str(self.skill_id) + ':' + intent_name
+            name = self._skill_id_colon + intent_name
             self.bus.emit(Message("detach_intent", {"intent_name": name}))
             return True
 
@@ -975,16 +1109,9 @@ class MycroftSkill:
         Returns:
             bool: True if enabled, False if it wasn't registered
         """
-        names = [intent[0] for intent in self.registered_intents]
-        intents = [intent[1] for intent in self.registered_intents]
-        if intent_name in names:
-            intent = intents[names.index(intent_name)]
-            self.registered_intents.remove((intent_name, intent))
-            if ".intent" in intent_name:
-                self.register_intent_file(intent_name, None)
-            else:
-                intent.name = intent_name
-                self.register_intent(intent, None)
+        intent = self._intent_map.get(intent_name)
+        if intent is not None:
+            self._reregister(intent_name, intent)
             LOG.debug('Enabling intent ' + intent_name)
             return True
 
@@ -992,6 +1119,22 @@ class MycroftSkill:
                                                       'registered.')
         return False
 
+    def _reregister(self, intent_name, intent):
+        """Send an already registered intent to the intent service again.
+
+        The intent service keeps detached adapt parsers, so only the name is
+        sent to reattach them. Padatious intents are registered again from
+        the stored intent data.
+
+        Arguments:
+            intent_name (str): name the intent was registered with
+            intent: Intent object or padatious intent data
+        """
+        if intent_name.endswith(".intent"):
+            self.bus.emit(Message("padatious:register_intent", intent))
+        else:
+            self.bus.emit(Message("reattach_intent", {"name": intent.name}))
+
     def set_context(self, context, word='', origin=None):
         """Add context to intent service
 
@@ -1005,7 +1148,7 @@ class MycroftSkill:
             raise ValueError('word should be a string')
 
         origin = origin or ''
-        context = to_alnum(self.skill_id) + context
+        context = self._alnum_skill_id + context
         self.bus.emit(Message('add_context',
                               {'context': context, 'word': word,
                                'origin': origin}))
@@ -1045,7 +1188,7 @@ class MycroftSkill:
         """Remove a keyword from the context manager."""
         if not isinstance(context, str):
             raise ValueError('context should be a string')
-        context = to_alnum(self.skill_id) + context
+        context = self._alnum_skill_id + context
         self.bus.emit(Message('remove_context', {'context': context}))
 
     def register_vocabulary(self, entity, entity_type):
@@ -1056,7 +1199,7 @@ class MycroftSkill:
             entity_type:    Intent handler entity to tie the word to
         """
         self.bus.emit(Message('register_vocab', {
-            'start': entity, 'end': to_alnum(self.skill_id) + entity_type
+            'start': entity, 'end': self._alnum_skill_id + entity_type
         }))
 
     def register_regex(self, regex_str):
@@ -1065,7 +1208,7 @@ class MycroftSkill:
             regex_str: Regex string
         """
         regex = munge_regex(regex_str, self.skill_id)
-        re.compile(regex)  # validate regex
+        _compile_regex(regex)  # validate regex
         self.bus.emit(Message('register_vocab', {'regex': regex}))
 
     def speak(self, utterance, expect_response=False, wait=False):
@@ -1111,15 +1254,39 @@ class MycroftSkill:
     def init_dialog(self, root_directory):
         # If "<skill>/dialog/<lang>" exists, load from there.  Otherwise
         # load dialog from "<skill>/locale/<lang>"
-        dialog_dir = join(root_directory, 'dialog', self.lang)
-        if exists(dialog_dir):
+        dialog_dir = self._get_lang_dir(root_directory, 'dialog')
+        if dialog_dir:
             self.dialog_renderer = DialogLoader().load(dialog_dir)
-        elif exists(join(root_directory, 'locale', self.lang)):
-            locale_path = join(root_directory, 'locale', self.lang)
-            self.dialog_renderer = DialogLoader().load(locale_path)
         else:
             LOG.debug('No dialog loaded')
 
+    def _get_lang_dir(self, root_directory, res_dirname):
+        """Get the directory to load a type of resource files from.
+
+        Arguments:
+            root_directory (str): root folder of the skill
+            res_dirname (str): resource directory, such as 'dialog', 'vocab'
+                               or 'regex'
+
+        Returns:
+            str: "<skill>/<res_dirname>/<lang>" if it exists, otherwise
+                 "<skill>/locale/<lang>" if that exists, else None
+        """
+        res_dir = join(root_directory, res_dirname, self.lang)
+        if exists(res_dir):
+            return res_dir
+
+        # While load_data_files() runs the locale directory is only checked
+        # once for all resource types
+        cache = self._locale_dir_cache
+        if cache is not None and root_directory in cache:
+            return cache[root_directory]
+        locale_dir = join(root_directory, 'locale', self.lang)
+        locale_dir = locale_dir if exists(locale_dir) else None
+        if cache is not None:
+            cache[root_directory] = locale_dir
+        return locale_dir
+
     def load_data_files(self, root_directory):
         """Load data files (intents, dialogs, etc).
 
@@ -1127,9 +1294,14 @@ class MycroftSkill:
             root_directory (str): root folder to use when loading files.
         """
         self.root_dir = root_directory
-        self.init_dialog(root_directory)
-        self.load_vocab_files(root_directory)
-        self.load_regex_files(root_directory)
+        self._resource_cache = {}
+        self._locale_dir_cache = {}
+        try:
+            self.init_dialog(root_directory)
+            self.load_vocab_files(root_directory)
+            self.load_regex_files(root_directory)
+        finally:
+            self._locale_dir_cache = None
 
     def load_vocab_files(self, root_directory):
         """ Load vocab files found under root_directory.
@@ -1137,12 +1309,13 @@ class MycroftSkill:
         Arguments:
             root_directory (str): root folder to use when loading files
         """
-        vocab_dir = join(root_directory, 'vocab', self.lang)
-        if exists(vocab_dir):
-            load_vocabulary(vocab_dir, self.bus, self.skill_id)
-        elif exists(join(root_directory, 'locale', self.lang)):
-            load_vocabulary(join(root_directory, 'locale', self.lang),
-                            self.bus, self.skill_id)
+        vocab_dir = self._get_lang_dir(root_directory, 'vocab')
+        if vocab_dir:
+            # Send all vocabulary of the skill in a single message
+            entries = read_vocabulary(vocab_dir, self.skill_id)
+            if entries:
+                self.bus.emit(Message('register_vocab_batch',
+                                      {'entries': entries}))
         else:
             LOG.debug('No vocab loaded')
 
@@ -1152,33 +1325,29 @@ class MycroftSkill:
         Arguments:
             root_directory (str): root folder to use when loading files
         """
-        regex_dir = join(root_directory, 'regex', self.lang)
-        if exists(regex_dir):
+        regex_dir = self._get_lang_dir(root_directory, 'regex')
+        if regex_dir:
             load_regex(regex_dir, self.bus, self.skill_id)
-        elif exists(join(root_directory, 'locale', self.lang)):
-            load_regex(join(root_directory, 'locale', self.lang),
-                       self.bus, self.skill_id)
 
     def __handle_stop(self, event):
         """Handler for the "mycroft.stop" signal. Runs the user defined
         `stop()` method.
         """
 
-        def __stop_timeout():
-            # The self.stop() call took more than 100ms, assume it handled Stop
-            self.bus.emit(Message("mycroft.stop.handled",
-                                  {"skill_id": str(self.skill_id) + ":"}))
-
-        timer = Timer(0.1, __stop_timeout)  # set timer for 100ms
+        start = time.monotonic()
         try:
             if self.stop():
                 self.bus.emit(Message("mycroft.stop.handled",
                                       {"by": "skill:"+str(self.skill_id)}))
-            timer.cancel()
         except Exception:
-            timer.cancel()
             LOG.error("Failed to stop skill: {}".format(self.name),
                       exc_info=True)
+        finally:
+            if time.monotonic() - start >= 0.1:
+                # The self.stop() call took more than 100ms, assume it
+                # handled Stop
+                self.bus.emit(Message("mycroft.stop.handled",
+                                      {"skill_id": self._skill_id_colon}))
 
     def stop(self):
         """Optional method implemented by subclass."""
@@ -1213,12 +1382,13 @@ class MycroftSkill:
 
         # removing events
         self.cancel_all_repeating_events()
-        for e, f in self.events:
-            self.bus.remove(e, f)
-        self.events = []  # Remove reference to wrappers
+        for e, handlers in self.events.items():
+            for f in handlers:
+                self.bus.remove(e, f)
+        self.events = {}  # Remove reference to wrappers
 
         self.bus.emit(
-            Message("detach_skill", {"skill_id": str(self.skill_id) + ":"}))
+            Message("detach_skill", {"skill_id": self._skill_id_colon}))
         try:
             self.stop()
         except Exception:
@@ -1235,7 +1405,7 @@ class MycroftSkill:
         Returns:
             str: name unique to this skill
         """
-        return str(self.skill_id) + ':' + (name or '')
+        return self._skill_id_colon + (name or '')
 
     def _schedule_event(self, handler, when, data=None, name=None,
                         repeat=None):
@@ -1243,19 +1413,17 @@ class MycroftSkill:
 
         Takes scheduling information and sends it off on the message bus.
         """
-        if not name:
-            name = self.name + handler.__name__
-        unique_name = self._unique_name(name)
+        name = name or self.name + handler.__name__
+        unique_name = self._skill_id_colon + name
         if repeat:
-            self.scheduled_repeats.append(name)  # store "friendly name"
+            self.scheduled_repeats.add(name)  # store "friendly name"
 
         data = data or {}
         self.add_event(unique_name, handler, once=not repeat)
-        event_data = {}
-        event_data['time'] = time.mktime(when.timetuple())
-        event_data['event'] = unique_name
-        event_data['repeat'] = repeat
-        event_data['data'] = data
+        event_data = {'time': when.timestamp(),
+                      'event': unique_name,
+                      'repeat': repeat,
+                      'data': data}
         self.bus.emit(Message('mycroft.scheduler.schedule_event',
                               data=event_data))
 
@@ -1324,8 +1492,7 @@ class MycroftSkill:
         """
         unique_name = self._unique_name(name)
         data = {'event': unique_name}
-        if name in self.scheduled_repeats:
-            self.scheduled_repeats.remove(name)
+        self.scheduled_repeats.discard(name)
         if self.remove_event(unique_name):
             self.bus.emit(Message('mycroft.scheduler.remove_event',
                                   data=data))
@@ -1345,34 +1512,29 @@ class MycroftSkill:
         event_name = self._unique_name(name)
         data = {'name': event_name}
 
-        # making event_status an object so it's refrence can be changed
         event_status = None
-        finished_callback = False
+        finished_callback = Event()
 
         def callback(message):
             nonlocal event_status
-            nonlocal finished_callback
             if message.data is not None:
                 event_time = int(message.data[0][0])
                 current_time = int(time.time())
                 time_left_in_seconds = event_time - current_time
                 event_status = time_left_in_seconds
-            finished_callback = True
+            finished_callback.set()
 
         emitter_name = 'mycroft.event_status.callback.{}'.format(event_name)
         self.bus.once(emitter_name, callback)
         self.bus.emit(Message('mycroft.scheduler.get_event', data=data))
 
-        start_wait = time.time()
-        while finished_callback is False and time.time() - start_wait < 3.0:
-            time.sleep(0.1)
-        if time.time() - start_wait > 3.0:
+        if not finished_callback.wait(3.0):
             raise Exception("Event Status Messagebus Timeout")
         return event_status
 
     def cancel_all_repeating_events(self):
         """Cancel any repeating events started by the skill."""
-        # NOTE: Gotta make a copy of the list due to the removes that happen
+        # NOTE: Gotta make a copy of the set due to the removes that happen
         #       in cancel_scheduled_event().
         for e in list(self.scheduled_repeats):
             self.cancel_scheduled_event(e)
@@ -1384,8 +1546,11 @@ class MycroftSkill:
         require a verbal response. This is intended to provide simple feedback
         to the user that their request was handled successfully.
         """
-        audio_file = resolve_resource_file(
-            self.config_core.get('sounds').get('acknowledge'))
+        if self._ack_audio_file is None:
+            # Resolve the sound once, False marks a missing file
+            self._ack_audio_file = resolve_resource_file(
+                self.config_core.get('sounds', {}).get('acknowledge')) or False
+        audio_file = self._ack_audio_file
 
         if not audio_file:
             LOG.warning("Could not find 'acknowledge' audio file!")
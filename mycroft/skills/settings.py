@@ -132,6 +132,9 @@ class SkillSettings(dict):
         # on disk (settings.json). So this prevents that
         # This is set to true in core.py after skill init
         self.allow_overwrite = False
+        # Set when the dict is changed through any of its methods, cleared
+        # on store()
+        self.dirty = False
 
         self.api = DeviceApi()
         self.config = ConfigurationManager.get()
@@ -247,8 +250,42 @@ class SkillSettings(dict):
     def __setitem__(self, key, value):
         """ Add/Update key. """
         if self.allow_overwrite or key not in self:
+            self.dirty = True
             return super(SkillSettings, self).__setitem__(key, value)
 
+    def __delitem__(self, key):
+        """ Remove key. """
+        self.dirty = True
+        return super(SkillSettings, self).__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        """ Add/Update several keys. """
+        self.dirty = True
+        return super(SkillSettings, self).update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        """ Add key if it doesn't exist. """
+        if key not in self:
+            self.dirty = True
+        return super(SkillSettings, self).setdefault(key, default)
+
+    def pop(self, key, *args):
+        """ Remove key and return its value. """
+        if key in self:
+            self.dirty = True
+        return super(SkillSettings, self).pop(key, *args)
+
+    def popitem(self):
+        """ Remove and return the last added key and value. """
+        item = super(SkillSettings, self).popitem()
+        self.dirty = True
+        return item
+
+    def clear(self):
+        """ Remove all keys. """
+        self.dirty = True
+        return super(SkillSettings, self).clear()
+
     def _load_settings_meta(self):
         """ Load settings metadata from the skill folder.
 
@@ -565,6 +602,7 @@ class SkillSettings(dict):
             with open(self._settings_path, 'w') as f:
                 json.dump(self, f)
             self.loaded_hash = hash(json.dumps(self, sort_keys=True))
+        self.dirty = False
 
         if self._should_upload_from_change:
             settings_meta = self._load_settings_meta()
@@ -47,26 +47,40 @@ def read_vocab_file(path):
     return vocab
 
 
-def load_vocab_from_file(path, vocab_type, bus):
-    """Load Mycroft vocabulary from file
-    The vocab is sent to the intent handler using the message bus
+def read_vocab_entries(path, vocab_type):
+    """Read the vocabulary entries of a vocab file.
 
     Args:
         path:           path to vocabulary file (*.voc)
         vocab_type:     keyword name
-        bus:            Mycroft messagebus connection
-        skill_id(str):  skill id
+
+    Returns:
+        List of dicts, the data of a register_vocab message for each word.
     """
+    entries = []
     if path.endswith('.voc'):
         for parts in read_vocab_file(path):
             entity = parts[0]
-            bus.emit(Message("register_vocab", {
-                'start': entity, 'end': vocab_type
-            }))
+            entries.append({'start': entity, 'end': vocab_type})
             for alias in parts[1:]:
-                bus.emit(Message("register_vocab", {
+                entries.append({
                     'start': alias, 'end': vocab_type, 'alias_of': entity
-                }))
+                })
+    return entries
+
+
+def load_vocab_from_file(path, vocab_type, bus):
+    """Load Mycroft vocabulary from file
+    The vocab is sent to the intent handler using the message bus
+
+    Args:
+        path:           path to vocabulary file (*.voc)
+        vocab_type:     keyword name
+        bus:            Mycroft messagebus connection
+        skill_id(str):  skill id
+    """
+    for entry in read_vocab_entries(path, vocab_type):
+        bus.emit(Message("register_vocab", entry))
 
 
 def load_regex_from_file(path, bus, skill_id):
@@ -82,26 +96,41 @@ def load_regex_from_file(path, bus, skill_id):
             for line in reg_file.readlines():
                 if line.startswith("#"):
                     continue
-                re.compile(munge_regex(line.strip(), skill_id))
-                bus.emit(
-                    Message("register_vocab",
-                            {'regex': munge_regex(line.strip(), skill_id)}))
+                regex = munge_regex(line.strip(), skill_id)
+                re.compile(regex)  # validate regex
+                bus.emit(Message("register_vocab", {'regex': regex}))
 
 
-def load_vocabulary(basedir, bus, skill_id):
-    """Load vocabulary from all files in the specified directory.
+def read_vocabulary(basedir, skill_id):
+    """Read vocabulary entries from all files in the specified directory.
 
     Args:
         basedir (str): path of directory to load from (will recurse)
-        bus (messagebus emitter): messagebus instance used to send the vocab to
-                                  the intent service
         skill_id: skill the data belongs to
+
+    Returns:
+        List of dicts, the data of a register_vocab message for each word.
     """
+    entries = []
     for path, _, files in walk(basedir):
         for f in files:
             if f.endswith(".voc"):
                 vocab_type = to_alnum(skill_id) + splitext(f)[0]
-                load_vocab_from_file(join(path, f), vocab_type, bus)
+                entries += read_vocab_entries(join(path, f), vocab_type)
+    return entries
+
+
+def load_vocabulary(basedir, bus, skill_id):
+    """Load vocabulary from all files in the specified directory.
+
+    Args:
+        basedir (str): path of directory to load from (will recurse)
+        bus (messagebus emitter): messagebus instance used to send the vocab to
+                                  the intent service
+        skill_id: skill the data belongs to
+    """
+    for entry in read_vocabulary(basedir, skill_id):
+        bus.emit(Message('register_vocab', entry))
 
 
 def load_regex(basedir, bus, skill_id):
@@ -472,8 +472,8 @@ def create_echo_function(name, whitelist=None):
             # Whitelist match beginning of message
             # i.e 'mycroft.audio.service' will allow the message
             # 'mycroft.audio.service.play' for example
-            if whitelist and not any([msg_type.startswith(e)
-                                     for e in whitelist]):
+            if whitelist and not any(msg_type.startswith(e)
+                                     for e in whitelist):
                 return
 
             if blacklist and msg_type in blacklist:
@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import json
+import os
 import sys
+import tempfile
 import unittest
 
 import mock
@@ -24,10 +27,12 @@ from datetime import datetime
 
 from mycroft.configuration import Configuration
 from mycroft.messagebus.message import Message
+from mycroft.skills.settings import SkillSettings
 from mycroft.skills.skill_data import load_regex_from_file, load_regex, \
     load_vocab_from_file, load_vocabulary
 from mycroft.skills.core import MycroftSkill, load_skill, \
-    create_skill_descriptor, open_intent_envelope, resting_screen_handler
+    create_skill_descriptor, open_intent_envelope, resting_screen_handler, \
+    intent_handler
 
 from test.util import base_config
 
@@ -285,7 +290,65 @@ class MycroftSkillTest(unittest.TestCase):
         s.disable_intent('a')
         self.check_detach_intent()
         s.enable_intent('a')
-        self.check_register_intent(expected)
+        # Only the name is sent when reattaching the intent
+        self.assertEqual(self.emitter.get_types(), ['reattach_intent'])
+        self.assertEqual(self.emitter.get_results(), [{'name': 'A:a'}])
+        self.emitter.reset()
+
+    def test_load_vocab_files(self):
+        s = SimpleSkill1()
+        s.bind(self.emitter)
+        self.emitter.reset()
+        s.load_vocab_files(abspath(dirname(__file__)))
+        # All vocabulary should be sent in a single message
+        self.assertEqual(self.emitter.get_types(), ['register_vocab_batch'])
+        entries = self.emitter.get_results()[0]['entries']
+        expected = [{'start': 'turn off', 'end': 'Aturn_off_test'},
+                    {'start': 'switch off', 'end': 'Aturn_off_test'},
+                    {'start': 'switch off', 'end': 'Aturn_off2_test'},
+                    {'start': 'turn off', 'end': 'Aturn_off2_test',
+                     'alias_of': 'switch off'}]
+        self.assertEqual(sorted(entries, key=lambda d: sorted(d.items())),
+                         sorted(expected, key=lambda d: sorted(d.items())))
+        self.emitter.reset()
+
+    def test_load_data_files_uses_public_hooks(self):
+        class HookSkill(_TestSkill):
+            def __init__(self):
+                super().__init__()
+                self.loaded = []
+
+            def init_dialog(self, root_directory):
+                self.loaded.append('dialog')
+
+            def load_vocab_files(self, root_directory):
+                self.loaded.append('vocab')
+
+            def load_regex_files(self, root_directory):
+                self.loaded.append('regex')
+
+        s = HookSkill()
+        s.bind(self.emitter)
+        s.load_data_files(abspath(dirname(__file__)))
+        self.assertEqual(s.loaded, ['dialog', 'vocab', 'regex'])
+        self.emitter.reset()
+
+    def test_load_data_files_checks_locale_once(self):
+        s = SimpleSkill1()
+        s.bind(self.emitter)
+        with tempfile.TemporaryDirectory() as root_dir:
+            locale_dir = join(root_dir, 'locale', 'en-us')
+            os.makedirs(locale_dir)
+            with mock.patch('mycroft.skills.mycroft_skill.exists',
+                            wraps=os.path.exists) as mock_exists:
+                s.load_data_files(root_dir)
+            checked = [c[0][0] for c in mock_exists.call_args_list]
+            self.assertEqual(checked.count(locale_dir), 1)
+            self.assertEqual(len(checked), 4)
+
+            # Calling a loader directly still finds the locale directory
+            self.assertEqual(s._get_lang_dir(root_dir, 'vocab'), locale_dir)
+        self.emitter.reset()
 
     def test_register_vocab(self):
         """Test disable/enable intent."""
@@ -338,6 +401,17 @@ class MycroftSkillTest(unittest.TestCase):
 
         self.check_register_object_file(expected_types, expected_results)
 
+    def test_find_resource_cached(self):
+        s = SimpleSkill1()
+        s.root_dir = abspath(join(dirname(__file__), 'intent_file'))
+        expected = join(s.root_dir, 'vocab', 'en-us', 'test.intent')
+        self.assertEqual(s.find_resource('test.intent', 'vocab'), expected)
+        # The second lookup should not touch the file system
+        with mock.patch('mycroft.skills.mycroft_skill.exists') as mock_exists:
+            self.assertEqual(s.find_resource('test.intent', 'vocab'),
+                             expected)
+            mock_exists.assert_not_called()
+
     def check_register_decorators(self, result_list):
         self.assertEqual(sorted(self.emitter.get_results(),
                                 key=lambda d: sorted(d.items())),
@@ -368,6 +442,58 @@ class MycroftSkillTest(unittest.TestCase):
         # Restore sys.path
         sys.path = path_orig
 
+    def test_register_decorators_skips_properties(self):
+        """ Test that decorated intents are found without using properties """
+        class PropertySkill(_TestSkill):
+            @property
+            def broken(self):
+                raise AssertionError('Property accessed during registration')
+
+            @intent_handler(IntentBuilder('a').require('Keyword').build())
+            def handler(self, message):
+                pass
+
+        s = PropertySkill()
+        s.bind(self.emitter)
+        s._register_decorated()
+        s.register_resting_screen()
+        expected = [{'at_least_one': [],
+                     'name': 'A:a',
+                     'optional': [],
+                     'requires': [('AKeyword', 'AKeyword')]}]
+        self.check_register_decorators(expected)
+
+    def test_register_decorators_subclass(self):
+        """ Test that decorated intents are collected for each class """
+        class BaseSkill(_TestSkill):
+            @intent_handler(IntentBuilder('a').require('Keyword').build())
+            def handler_a(self, message):
+                pass
+
+        class ChildSkill(BaseSkill):
+            @intent_handler(IntentBuilder('b').require('Keyword').build())
+            def handler_b(self, message):
+                pass
+
+        base = BaseSkill()
+        base.bind(self.emitter)
+        base._register_decorated()
+        expected_a = {'at_least_one': [],
+                      'name': 'A:a',
+                      'optional': [],
+                      'requires': [('AKeyword', 'AKeyword')]}
+        self.check_register_decorators([expected_a])
+
+        # The collection cached on the base class must not be reused
+        child = ChildSkill()
+        child.bind(self.emitter)
+        child._register_decorated()
+        expected_b = {'at_least_one': [],
+                      'name': 'A:b',
+                      'optional': [],
+                      'requires': [('AKeyword', 'AKeyword')]}
+        self.check_register_decorators([expected_a, expected_b])
+
     def test_failing_set_context(self):
         s = SimpleSkill1()
         s.bind(self.emitter)
@@ -444,7 +570,28 @@ class MycroftSkillTest(unittest.TestCase):
         # Check that the handler was registered with the emitter
         self.assertEqual(emitter.on.call_args[0][0], 'handler1')
         # Check that the handler was stored in the skill
-        self.assertTrue('handler1' in [e[0] for e in s.events])
+        self.assertTrue('handler1' in s.events)
+
+    @mock.patch.dict(Configuration._Configuration__config, BASE_CONF)
+    def test_event_stores_nested_settings_change(self):
+        emitter = mock.MagicMock()
+        s = SimpleSkill1()
+        s.bind(emitter)
+        with tempfile.TemporaryDirectory() as settings_dir:
+            s.settings = SkillSettings(settings_dir, 'Test')
+            s.settings.allow_overwrite = True
+            s.settings['items'] = []
+            s.settings.store()
+
+            def handler(message):
+                # In place changes don't mark the settings as dirty
+                s.settings['items'].append('milk')
+
+            s.add_event('handler1', handler)
+            emitter.on.call_args[0][1](Message('handler1'))
+            s.settings.stop_polling()
+            with open(join(settings_dir, 'settings.json')) as f:
+                self.assertEqual(json.load(f), {'items': ['milk']})
 
     @mock.patch.dict(Configuration._Configuration__config, BASE_CONF)
     def test_remove_event(self):
@@ -452,15 +599,31 @@ class MycroftSkillTest(unittest.TestCase):
         s = SimpleSkill1()
         s.bind(emitter)
         s.add_event('handler1', s.handler)
-        self.assertTrue('handler1' in [e[0] for e in s.events])
+        self.assertTrue('handler1' in s.events)
         # Remove event handler
         s.remove_event('handler1')
         # make sure it's not in the event list anymore
-        self.assertTrue('handler1' not in [e[0] for e in s.events])
+        self.assertTrue('handler1' not in s.events)
         # Check that the handler was registered with the emitter
         self.assertEqual(emitter.remove_all_listeners.call_args[0][0],
                          'handler1')
 
+    @mock.patch.dict(Configuration._Configuration__config, BASE_CONF)
+    def test_remove_event_shared_name(self):
+        emitter = mock.MagicMock()
+        s = SimpleSkill1()
+        s.bind(emitter)
+        s.add_event('handler1', s.handler)
+        s.add_event('handler1', s.handler)
+        self.assertEqual(len(s.events['handler1']), 2)
+        emitter.reset_mock()
+        # Remove both event handlers
+        self.assertTrue(s.remove_event('handler1'))
+        self.assertTrue('handler1' not in s.events)
+        emitter.remove_all_listeners.assert_called_once_with('handler1')
+        # Removing again should report that nothing was removed
+        self.assertFalse(s.remove_event('handler1'))
+
     @mock.patch.dict(Configuration._Configuration__config, BASE_CONF)
     def test_add_scheduled_event(self):
         emitter = mock.MagicMock()
@@ -470,17 +633,17 @@ class MycroftSkillTest(unittest.TestCase):
         s.schedule_event(s.handler, datetime.now(), name='datetime_handler')
         # Check that the handler was registered with the emitter
         self.assertEqual(emitter.once.call_args[0][0], 'A:datetime_handler')
-        self.assertTrue('A:datetime_handler' in [e[0] for e in s.events])
+        self.assertTrue('A:datetime_handler' in s.events)
 
         s.schedule_event(s.handler, 1, name='int_handler')
         # Check that the handler was registered with the emitter
         self.assertEqual(emitter.once.call_args[0][0], 'A:int_handler')
-        self.assertTrue('A:int_handler' in [e[0] for e in s.events])
+        self.assertTrue('A:int_handler' in s.events)
 
         s.schedule_event(s.handler, .5, name='float_handler')
         # Check that the handler was registered with the emitter
         self.assertEqual(emitter.once.call_args[0][0], 'A:float_handler')
-        self.assertTrue('A:float_handler' in [e[0] for e in s.events])
+        self.assertTrue('A:float_handler' in s.events)
 
     @mock.patch.dict(Configuration._Configuration__config, BASE_CONF)
     def test_remove_scheduled_event(self):
@@ -489,12 +652,12 @@ class MycroftSkillTest(unittest.TestCase):
         s.bind(emitter)
         s.schedule_event(s.handler, datetime.now(), name='sched_handler1')
         # Check that the handler was registered with the emitter
-        self.assertTrue('A:sched_handler1' in [e[0] for e in s.events])
+        self.assertTrue('A:sched_handler1' in s.events)
         s.cancel_scheduled_event('sched_handler1')
         # Check that the handler was removed
         self.assertEqual(emitter.remove_all_listeners.call_args[0][0],
                          'A:sched_handler1')
-        self.assertTrue('A:sched_handler1' not in [e[0] for e in s.events])
+        self.assertTrue('A:sched_handler1' not in s.events)
 
     @mock.patch.dict(Configuration._Configuration__config, BASE_CONF)
     def test_run_scheduled_event(self):
@@ -510,7 +673,43 @@ class MycroftSkillTest(unittest.TestCase):
             self.assertTrue(s.handler_run)
             # Check that the handler was removed from the list of registred
             # handler
-            self.assertTrue('A:sched_handler1' not in [e[0] for e in s.events])
+            self.assertTrue('A:sched_handler1' not in s.events)
+
+    def test_translate_list_reloads_edited_file(self):
+        s = SimpleSkill1()
+        with tempfile.TemporaryDirectory() as root_dir:
+            s.root_dir = root_dir
+            dialog_dir = join(root_dir, 'dialog', 'en-us')
+            os.makedirs(dialog_dir)
+            list_file = join(dialog_dir, 'colors.list')
+            with open(list_file, 'w') as f:
+                f.write('red\n{{color}}\n')
+            self.assertEqual(s.translate_list('colors', {'color': 'blue'}),
+                             ['red', 'blue'])
+
+            with open(list_file, 'w') as f:
+                f.write('green\n')
+            # Make sure the modification time changes
+            os.utime(list_file, (0, 0))
+            self.assertEqual(s.translate_list('colors'), ['green'])
+            # The text of the edited file replaces the cached entry
+            self.assertEqual(len(s._template_cache), 1)
+
+    @mock.patch('mycroft.skills.mycroft_skill.time')
+    def test_slow_failing_stop(self, mock_time):
+        class FailingStopSkill(_TestSkill):
+            def stop(self):
+                raise RuntimeError('stop failed')
+
+        # stop() takes 200 ms before it raises
+        mock_time.monotonic.side_effect = [0.0, 0.2]
+        s = FailingStopSkill()
+        s.bind(self.emitter)
+        self.emitter.reset()
+        s._MycroftSkill__handle_stop(Message('mycroft.stop'))
+        self.assertEqual(self.emitter.get_types(), ['mycroft.stop.handled'])
+        self.assertEqual(self.emitter.get_results(), [{'skill_id': 'A:'}])
+        self.emitter.reset()
 
     def test_voc_match(self):
         s = SimpleSkill1()
@@ -14,7 +14,11 @@
 #
 import unittest
 
-from mycroft.skills.intent_service import ContextManager
+import mock
+from adapt.intent import IntentBuilder
+
+from mycroft.messagebus.message import Message
+from mycroft.skills.intent_service import ContextManager, IntentService
 
 
 class MockEmitter(object):
@@ -68,5 +72,93 @@ class ContextManagerTest(unittest.TestCase):
         self.assertEqual(len(self.context_manager.frame_stack), 0)
 
 
+class IntentServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.intent_service = IntentService(mock.MagicMock())
+
+    def register_intent(self, name):
+        intent = IntentBuilder(name).require('Keyword').build()
+        self.intent_service.handle_register_intent(
+            Message('register_intent', intent.__dict__))
+
+    def parser_names(self):
+        return [p.name for p in self.intent_service.engine.intent_parsers]
+
+    def test_register_vocab_batch(self):
+        entries = [{'start': 'turn off', 'end': 'Aturn_off'},
+                   {'start': 'switch off', 'end': 'Aturn_off',
+                    'alias_of': 'turn off'},
+                   {'regex': '(?P<ATarget>.*)'}]
+
+        # Register the entries one by one
+        self.intent_service.engine = mock.MagicMock()
+        for entry in entries:
+            self.intent_service.handle_register_vocab(
+                Message('register_vocab', entry))
+        expected = self.intent_service.engine.mock_calls
+
+        # Register the entries in a single batch
+        self.intent_service.engine = mock.MagicMock()
+        self.intent_service.handle_register_vocab_batch(
+            Message('register_vocab_batch', {'entries': entries}))
+        self.assertEqual(self.intent_service.engine.mock_calls, expected)
+        self.assertEqual(expected, [
+            mock.call.register_entity('turn off', 'Aturn_off',
+                                      alias_of=None),
+            mock.call.register_entity('switch off', 'Aturn_off',
+                                      alias_of='turn off'),
+            mock.call.register_regex_entity('(?P<ATarget>.*)')
+        ])
+
+    def test_detach_reattach_intent(self):
+        self.register_intent('A:a')
+        self.register_intent('A:b')
+        self.intent_service.handle_detach_intent(
+            Message('detach_intent', {'intent_name': 'A:a'}))
+        self.assertEqual(self.parser_names(), ['A:b'])
+        self.assertIn('A:a', self.intent_service.detached_intents)
+
+        self.intent_service.handle_reattach_intent(
+            Message('reattach_intent', {'name': 'A:a'}))
+        self.assertEqual(sorted(self.parser_names()), ['A:a', 'A:b'])
+        self.assertEqual(self.intent_service.detached_intents, {})
+
+    def test_detach_skill_drops_detached_intents(self):
+        self.register_intent('A:a')
+        self.register_intent('B:a')
+        self.intent_service.handle_detach_intent(
+            Message('detach_intent', {'intent_name': 'A:a'}))
+        self.intent_service.handle_detach_intent(
+            Message('detach_intent', {'intent_name': 'B:a'}))
+        self.intent_service.handle_detach_skill(
+            Message('detach_skill', {'skill_id': 'A:'}))
+        self.assertEqual(list(self.intent_service.detached_intents), ['B:a'])
+
+        # The parser of the detached skill can't be reattached
+        self.intent_service.handle_reattach_intent(
+            Message('reattach_intent', {'name': 'A:a'}))
+        self.assertEqual(self.parser_names(), [])
+
+    def test_register_intent_drops_detached_intent(self):
+        self.register_intent('A:a')
+        self.intent_service.handle_detach_intent(
+            Message('detach_intent', {'intent_name': 'A:a'}))
+        self.register_intent('A:a')
+        self.assertEqual(self.intent_service.detached_intents, {})
+
+        # Reattaching must not add the stale parser next to the new one
+        self.intent_service.handle_reattach_intent(
+            Message('reattach_intent', {'name': 'A:a'}))
+        self.assertEqual(self.parser_names(), ['A:a'])
+
+    @mock.patch('mycroft.skills.intent_service.LOG')
+    def test_reattach_unknown_intent(self, mock_log):
+        self.register_intent('A:a')
+        self.intent_service.handle_reattach_intent(
+            Message('reattach_intent', {'name': 'A:b'}))
+        self.assertTrue(mock_log.warning.called)
+        self.assertEqual(self.parser_names(), ['A:a'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -119,6 +119,38 @@ class SkillSettingsTest(unittest.TestCase):
         s2.load_skill_settings_from_file()
         self.assertTrue(len(s) == len(s2))
 
+    def test_dirty(self):
+        s = SkillSettings(join(dirname(__file__), 'settings'),
+                          "test-skill-settings")
+        s.allow_overwrite = True
+        self.assertFalse(s.dirty)
+        s['test_val'] = 1
+        self.assertTrue(s.dirty)
+        s.store()
+        self.assertFalse(s.dirty)
+        del s['test_val']
+        self.assertTrue(s.dirty)
+
+        mutations = [
+            lambda: s.update({'test_val': 2}),
+            lambda: s.setdefault('new_val', 3),
+            lambda: s.pop('new_val'),
+            lambda: s.popitem(),
+            lambda: s.clear()
+        ]
+        for mutate in mutations:
+            s.store()
+            self.assertFalse(s.dirty)
+            mutate()
+            self.assertTrue(s.dirty)
+
+        # Calls leaving the settings unchanged don't mark them as dirty
+        s['test_val'] = 1
+        s.store()
+        s.setdefault('test_val', 2)
+        s.pop('missing', None)
+        self.assertFalse(s.dirty)
+
     def test_load_existing(self):
         directory = join(dirname(__file__), 'settings', 'settings.json')
         with open(directory, 'w') as f: